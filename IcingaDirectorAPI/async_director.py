@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+"""
+Icinga Director API asyncio client
+
+Requires the optional dependency aiohttp (pip install IcingaDirectorAPI[async]).
+"""
+
+from typing import List
+from urllib.parse import urljoin
+
+import asyncio
+import logging
+import ssl
+
+import aiohttp
+
+from IcingaDirectorAPI.base import _parse_body, _parse_error_body
+from IcingaDirectorAPI.exceptions import IcingaDirectorApiException
+from IcingaDirectorAPI.exceptions import IcingaDirectorApiRequestException
+from IcingaDirectorAPI.objects import Objects, _filter_kind
+from IcingaDirectorAPI import __version__
+
+LOG = logging.getLogger(__name__)
+
+
+async def _gather(coros: list,
+                  return_exceptions: bool) -> list:
+    """
+    run coros concurrently and return their results in order
+
+    Without return_exceptions the first failure is raised after the remaining
+    requests have been cancelled and finished, so none of them outlive the call
+    (e.g. by running on while the session is closed).
+    """
+
+    if return_exceptions:
+        return await asyncio.gather(*coros, return_exceptions=True)
+
+    tasks = [asyncio.ensure_future(c) for c in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class AsyncObjects(Objects):
+    """
+    Icinga Director API objects class for the asyncio client
+
+    Offers the same methods as Objects, as coroutines.
+    """
+
+    __slots__ = ()
+
+    # pylint: disable=invalid-overridden-method
+
+    async def _request(self,
+                       method: str,
+                       url_path: str,
+                       payload: dict = None,
+                       cache: bool = True) -> dict:  # pylint: disable=unused-argument
+        """
+        make the request and return the body
+
+        :param method: the HTTP method
+        :type method: string
+        :param url_path: the requested url path
+        :type url_path: string
+        :param payload: the payload to send
+        :type payload: dictionary
+        :param cache: ignored, the asyncio client does not cache responses
+        :type cache: bool
+        :returns: the response as json
+        :rtype: dictionary
+        """
+
+        method = method.upper()
+        request_url = self._get_request_url(url_path)
+        LOG.debug("Request URL: %s", request_url)
+
+        # never send a body with GET requests
+        if payload is not None and method == 'GET':
+            payload = None
+
+        session = self.manager.get_session()
+        async with session.request(method, request_url, json=payload or None) as response:
+            content = await response.read()
+
+            if not 200 <= response.status <= 299:
+                raise IcingaDirectorApiRequestException(
+                    f'Request "{response.url}" failed with status {response.status}:'
+                    f' {content.decode(errors="replace")}', _parse_error_body(content))
+
+        return _parse_body(content)
+
+    async def get(self,
+                  object_type: str,
+                  name: str) -> dict:
+        """
+        get object of given type by given name, see Objects.get()
+        """
+
+        url_path = self._get_object_url_path(object_type, name, 'get')
+
+        return await self._request('GET', url_path)
+
+    async def list(self,
+                   object_type: str,
+                   query: str = None) -> list:
+        """
+        list or filter all objects of given type (by name), see Objects.list()
+        """
+
+        url_path = self._get_list_url_path(object_type, query)
+        result = await self._request('GET', url_path)
+
+        return _filter_kind(result['objects'], self._get_handler(object_type).list_kind)
+
+    async def iter_list(self,
+                        object_type: str,
+                        query: str = None):
+        """
+        iterate over all objects of given type (by name), see Objects.iter_list()
+
+        The asyncio client does not stream, the objects are yielded from list().
+        """
+
+        for obj in await self.list(object_type, query):
+            yield obj
+
+    async def create(self,
+                     object_type: str,
+                     name: str,
+                     templates: list = None,
+                     attrs: dict = None) -> dict:
+        """
+        create an object, see Objects.create()
+        """
+
+        url_path = self._get_url_path(object_type, 'create')
+        payload = self._get_create_payload(object_type, name, templates, attrs)
+
+        return await self._request('POST', url_path, payload)
+
+    async def modify(self,
+                     object_type: str,
+                     name: str,
+                     attrs: dict) -> dict:
+        """
+        modify an object, see Objects.modify()
+        """
+
+        url_path = self._get_object_url_path(object_type, name, 'modify')
+
+        return await self._request('POST', url_path, attrs)
+
+    async def delete(self,
+                     object_type: str,
+                     name: str) -> dict:
+        """
+        delete an object, see Objects.delete()
+        """
+
+        url_path = self._get_object_url_path(object_type, name, 'delete')
+
+        return await self._request('DELETE', url_path)
+
+    async def bulk_create(self,
+                          items: List[dict],
+                          return_exceptions: bool = False) -> List:
+        """
+        create many objects concurrently
+
+        :param items: keyword arguments of create() for every object
+        :type items: list of dictionaries
+        :param return_exceptions: return failed requests' exceptions instead of raising the first
+        :type return_exceptions: bool
+        :returns: the responses in the order of items
+        :rtype: list
+
+        Without return_exceptions the first failure cancels all requests still running, so
+        it is unknown which of the other objects were created. Pass return_exceptions=True
+        to learn the outcome of every object.
+
+        example:
+        await bulk_create([{'object_type': 'Host', 'name': 'host1', 'templates': ['generic-host']},
+                           {'object_type': 'Host', 'name': 'host2', 'templates': ['generic-host']}])
+        """
+
+        return await _gather([self.create(**i) for i in items], return_exceptions)
+
+    async def create_many(self,
+                          object_type: str,
+                          items: List[dict],
+                          return_exceptions: bool = False) -> List:
+        """
+        create many objects of the same type concurrently, see Objects.create_many()
+        """
+
+        return await _gather(
+            [self.create(object_type, i['name'], i.get('templates'), i.get('attrs'))
+             for i in items], return_exceptions)
+
+    async def modify_many(self,
+                          object_type: str,
+                          items: List[dict],
+                          return_exceptions: bool = False) -> List:
+        """
+        modify many objects of the same type concurrently, see Objects.modify_many()
+        """
+
+        return await _gather(
+            [self.modify(object_type, i['name'], i['attrs']) for i in items], return_exceptions)
+
+    async def delete_many(self,
+                          object_type: str,
+                          names: List[str],
+                          return_exceptions: bool = False) -> List:
+        """
+        delete many objects of the same type concurrently, see Objects.delete_many()
+        """
+
+        return await _gather([self.delete(object_type, n) for n in names], return_exceptions)
+
+
+class AsyncDirector:  # pylint: disable=too-many-instance-attributes
+    """
+    Icinga Director asyncio Client class
+    """
+
+    __slots__ = ('url', 'url_base', 'username', 'password', 'timeout', 'limit', 'verify',
+                 'objects', 'version', 'session')
+
+    def __init__(self,  # pylint: disable=too-many-arguments
+                 url=None,
+                 username=None,
+                 password=None,
+                 timeout=None,
+                 limit=32,
+                 verify=False):
+        """
+        initialize object
+
+        :param limit: maximum number of concurrent connections
+        :type limit: int
+        :param verify: validate the server's TLS certificate, optionally against a CA bundle path
+        :type verify: bool or string
+        """
+        self.url = url
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self.verify = verify
+        self.limit = limit
+        self.objects = AsyncObjects(self)
+        self.version = __version__
+        self.session = None
+
+        if not self.url:
+            raise IcingaDirectorApiException('No "url" defined.')
+        if not self.username or not self.password:
+            raise IcingaDirectorApiException('username and/or password not defined.')
+
+        # directory of url that relative request paths are resolved against
+        self.url_base = urljoin(self.url, '.')
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """
+        return the session shared by all requests, creating it on first use
+        (aiohttp sessions have to be created inside the running event loop)
+        """
+
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                auth=aiohttp.BasicAuth(self.username, self.password),
+                headers={
+                    'Accept': 'application/json',
+                    'User-Agent': f'IcingaDirectorAPI/{self.version}'
+                },
+                connector=aiohttp.TCPConnector(limit=self.limit, ssl=self._get_ssl()),
+                timeout=aiohttp.ClientTimeout(total=self.timeout))
+
+        return self.session
+
+    def _get_ssl(self):
+        """
+        translate verify into aiohttp's ssl argument
+        """
+
+        if isinstance(self.verify, str):
+            return ssl.create_default_context(cafile=self.verify)
+        if self.verify:
+            return None
+
+        return False
+
+    async def close(self):
+        """
+        close the session and release pooled connections
+        """
+
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
@@ -5,19 +5,54 @@ Icinga Director API client base
 
 from urllib.parse import urljoin
 
+import gzip
 import logging
-import requests
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 from IcingaDirectorAPI.exceptions import IcingaDirectorApiRequestException
 
 LOG = logging.getLogger(__name__)
 
 
+def _parse_body(content: bytes) -> dict:
+    """
+    parse a json response body, empty bodies (e.g. 204 No Content) result in an empty dict
+    """
+
+    if not content:
+        return {}
+
+    return _loads(content)
+
+
+def _parse_error_body(content: bytes) -> dict:
+    """
+    parse the body of a failed request, non-json bodies (e.g. a proxy's HTML 502 page)
+    result in an empty dict
+    """
+
+    try:
+        return _parse_body(content)
+    except ValueError:
+        return {}
+
+
 class Base:  # pylint: disable=too-few-public-methods
     """
     Icinga Director API Base Class
     """
 
+    __slots__ = ('manager',)
+
     base_url_path = None
 
     def __init__(self, manager):
@@ -27,21 +62,25 @@ class Base:  # pylint: disable=too-few-public-methods
 
         self.manager = manager
 
-    def _create_session(self) -> requests.Session:
+    def _get_request_url(self,
+                         url_path: str) -> str:
         """
-        create a session object
+        return the absolute url of url_path
+
+        Relative paths are appended to the client's precomputed url base, which resolves
+        them exactly like urljoin() but without parsing both urls on every request.
         """
 
-        session = requests.Session()
-        session.auth = (self.manager.username, self.manager.password)
-        session.headers = {'Accept': 'application/json'}
+        if url_path.startswith(('/', 'http://', 'https://')):
+            return urljoin(self.manager.url, url_path)
 
-        return session
+        return self.manager.url_base + url_path
 
     def _request(self,
                  method: str,
                  url_path: str,
-                 payload: dict = None) -> dict:
+                 payload: dict = None,
+                 cache: bool = True) -> dict:
         """
         make the request and return the body
 
@@ -51,30 +90,80 @@ class Base:  # pylint: disable=too-few-public-methods
         :type url_path: string
         :param payload: the payload to send
         :type payload: dictionary
+        :param cache: serve and store GET responses from and in the client's cache
+        :type cache: bool
         :returns: the response as json
         :rtype: dictionary
         """
 
-        request_url = urljoin(self.manager.url, url_path)
+        method = method.upper()
+        request_url = self._get_request_url(url_path)
         LOG.debug("Request URL: %s", request_url)
 
-        # create session
-        session = self._create_session()
+        if method == 'GET':
+            # never send a body with GET requests
+            payload = None
 
-        # create arguments for the request
-        request_args = {
-            'url': request_url,
-            'verify': False
-        }
-        if payload:
-            request_args['json'] = payload
+            cached = self.manager.cache_get(request_url) if cache else None
+            if cached is not None:
+                LOG.debug("Serving cached response for: %s", request_url)
+                return cached
 
-        # do the request
-        response = session.request(method, **request_args)
+        # do the request on the client's shared session
+        response = self.manager.session.request(method, request_url, json=payload or None,
+                                                timeout=self.manager.timeout)
 
         if not 200 <= response.status_code <= 299:
             raise IcingaDirectorApiRequestException(
                 f'Request "{response.url}" failed with status {response.status_code}:'
-                f' {response.text}', response.json())
+                f' {response.text}', _parse_error_body(response.content))
+
+        result = _parse_body(response.content)
+        if method == 'GET' and cache:
+            self.manager.cache_set(request_url, result)
+
+        return result
+
+    def _stream(self,
+                url_path: str,
+                prefix: str):
+        """
+        make a GET request and yield the items below prefix while the body is downloaded
+
+        Uses ijson to parse the response incrementally, without ijson the complete
+        response is parsed first.
+
+        :param url_path: the requested url path
+        :type url_path: string
+        :param prefix: ijson prefix of the items to yield, e.g. "objects.item"
+        :type prefix: string
+        :returns: generator of the items
+        """
 
-        return response.json()
+        if ijson is None:
+            data = self._request('GET', url_path, cache=False)
+            for key in prefix.split('.')[:-1]:
+                data = data[key]
+            yield from data
+            return
+
+        request_url = self._get_request_url(url_path)
+        LOG.debug("Streaming request URL: %s", request_url)
+
+        with self.manager.session.request('GET', request_url, timeout=self.manager.timeout,
+                                          stream=True) as response:
+            if not 200 <= response.status_code <= 299:
+                raise IcingaDirectorApiRequestException(
+                    f'Request "{response.url}" failed with status {response.status_code}:'
+                    f' {response.text}', _parse_error_body(response.content))
+
+            # decompress gzip bodies with zlib's file reader instead of urllib3's decoder,
+            # let urllib3 undo any other transfer compression
+            if response.headers.get('Content-Encoding') == 'gzip':
+                response.raw.decode_content = False
+                body = gzip.GzipFile(fileobj=response.raw)
+            else:
+                response.raw.decode_content = True
+                body = response.raw
+
+            yield from ijson.items(body, prefix, use_float=True)
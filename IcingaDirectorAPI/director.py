@@ -3,7 +3,18 @@
 Icinga Director API client base
 """
 
+from collections import OrderedDict
+from copy import deepcopy
+from urllib.parse import urljoin
+
 import logging
+import threading
+import time
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from IcingaDirectorAPI.exceptions import IcingaDirectorApiException
 from IcingaDirectorAPI.objects import Objects
@@ -11,24 +22,53 @@ from IcingaDirectorAPI import __version__
 
 LOG = logging.getLogger(__name__)
 
+# maximum number of GET responses kept in the response cache
+CACHE_SIZE = 128
+
+# retry idempotent requests failing with these (usually transient) gateway errors
+RETRY_STATUS = (502, 503, 504)
 
-class Director:  # pylint: disable=too-few-public-methods
+
+class Director:  # pylint: disable=too-many-instance-attributes
     """
     Icinga Director Client class
     """
 
-    def __init__(self,
+    __slots__ = ('url', 'url_base', 'username', 'password', 'timeout', 'cache_ttl', 'verify',
+                 'pool_maxsize', 'retries', 'objects', 'version', 'session', '_get_cache',
+                 '_cache_lock')
+
+    def __init__(self,  # pylint: disable=too-many-arguments
                  url=None,
                  username=None,
                  password=None,
-                 timeout=None):
+                 timeout=None,
+                 cache_ttl=0,
+                 verify=False,
+                 pool_maxsize=64,
+                 retries=3):
         """
         initialize object
+
+        :param cache_ttl: seconds a GET response is served from the cache, 0 (default) disables it
+        :type cache_ttl: number
+        :param verify: validate the server's TLS certificate, optionally against a CA bundle path
+        :type verify: bool or string
+        :param pool_maxsize: maximum number of pooled connections
+        :type pool_maxsize: int
+        :param retries: how often idempotent requests are retried on connection or gateway errors
+        :type retries: int
         """
         self.url = url
         self.username = username
         self.password = password
         self.timeout = timeout
+        self.verify = verify
+        self.pool_maxsize = pool_maxsize
+        self.retries = retries
+        self.cache_ttl = cache_ttl
+        self._get_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
         self.objects = Objects(self)
         self.version = __version__
 
@@ -36,3 +76,110 @@ class Director:  # pylint: disable=too-few-public-methods
             raise IcingaDirectorApiException('No "url" defined.')
         if not self.username or not self.password:
             raise IcingaDirectorApiException('username and/or password not defined.')
+
+        # directory of url that relative request paths are resolved against
+        self.url_base = urljoin(self.url, '.')
+
+        if not self.verify:
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+        self.session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        """
+        create the session object shared by all requests of this client
+        """
+
+        session = requests.Session()
+        session.auth = (self.username, self.password)
+        session.verify = self.verify
+        session.headers.update({
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
+            'User-Agent': f'IcingaDirectorAPI/{self.version}'
+        })
+
+        # POST is left out, since retrying a create could run it twice;
+        # the last response is returned, so failures still raise our own exception
+        retry = Retry(total=self.retries,
+                      backoff_factor=0.2,
+                      status_forcelist=RETRY_STATUS,
+                      allowed_methods=frozenset(['GET', 'DELETE']),
+                      raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.pool_maxsize,
+                              max_retries=retry)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+        return session
+
+    def cache_get(self, request_url: str):
+        """
+        return a copy of the cached response for request_url or None
+        """
+
+        if not self.cache_ttl:
+            return None
+
+        with self._cache_lock:
+            entry = self._get_cache.get(request_url)
+            if entry is None:
+                return None
+
+            stored, response = entry
+            if time.monotonic() - stored > self.cache_ttl:
+                self._get_cache.pop(request_url, None)
+                return None
+
+            self._get_cache.move_to_end(request_url)
+
+        # cached responses are never mutated, so they can be copied outside the lock
+        return deepcopy(response)
+
+    def cache_set(self, request_url: str, response):
+        """
+        store a GET response in the cache
+        """
+
+        if not self.cache_ttl:
+            return
+
+        entry = (time.monotonic(), deepcopy(response))
+
+        with self._cache_lock:
+            self._get_cache[request_url] = entry
+            self._get_cache.move_to_end(request_url)
+            while len(self._get_cache) > CACHE_SIZE:
+                self._get_cache.popitem(last=False)
+
+    def invalidate_cache(self, url_path: str):
+        """
+        drop all cached responses whose url starts with url_path
+        """
+
+        prefix = self.url_base + url_path
+
+        with self._cache_lock:
+            for key in [k for k in self._get_cache if k.startswith(prefix)]:
+                self._get_cache.pop(key, None)
+
+    def clear_cache(self):
+        """
+        drop all cached responses
+        """
+
+        with self._cache_lock:
+            self._get_cache.clear()
+
+    def close(self):
+        """
+        close the session and release pooled connections
+        """
+
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
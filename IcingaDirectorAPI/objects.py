@@ -3,92 +3,269 @@
 Icinga Director API client base
 """
 
+from functools import partial
+from typing import Callable, List
+from urllib.parse import quote
+
 import logging
 
+import requests
+
 from IcingaDirectorAPI.base import Base
 from IcingaDirectorAPI.exceptions import IcingaDirectorApiException
 
 LOG = logging.getLogger(__name__)
 
 
+ALLOWED_MODES = ('create', 'delete', 'get', 'list', 'modify')
+
+# url-encode user supplied values, including "/", "&", "?" and "#"
+_quote = partial(quote, safe='')
+
+# commands and command templates share one list endpoint, distinguished by object_type
+COMMAND_KINDS = {'Command': 'object', 'CommandTemplate': 'template'}
+
+
+def _compute_endpoint(object_type: str,
+                      mode: str) -> str:
+    """
+    derive the Icinga Director API endpoint of object_type for mode
+    """
+
+    if mode == 'list':
+        if object_type.startswith('Command'):
+            return 'commands'
+        if object_type.endswith('Template'):
+            return object_type.lower().replace('template', 's/templates')
+        if object_type in ['Notification', 'ServiceApplyRule']:
+            return object_type.replace('ApplyRule', '').lower() + 's/applyrules'
+        return object_type.lower() + 's'
+
+    return object_type.lower().replace('template', '').replace('applyrule', '')
+
+
+def _split_service_name(name: str) -> tuple:
+    """
+    separate host and service name
+    """
+
+    host, sep, service = name.partition('!')
+    if not sep or '!' in service:
+        raise IcingaDirectorApiException(
+            'Service object must have form "hostname!servicename".')
+    return host, service
+
+
+def _filter_kind(objects: list,
+                 kind: str = None) -> list:
+    """
+    separate commands from command templates, which share one endpoint
+
+    Only a safety net in case Director ignores the object_type filter.
+    """
+
+    if kind is None:
+        return objects
+
+    return [c for c in objects if c["object_type"] == kind]
+
+
+class _Handler:
+    """
+    object_type specific request details, resolved once per object_type and base url path
+    """
+
+    __slots__ = ('url_paths', 'director_object_type', 'list_kind')
+
+    def __init__(self, object_type: str, base_url_path: str):
+        # endpoint url paths never change, so resolve them for all modes up front
+        self.url_paths: dict = {m: f'{base_url_path}/{_compute_endpoint(object_type, m)}'
+                                for m in ALLOWED_MODES}
+
+        if object_type.endswith('Template'):
+            self.director_object_type = 'template'
+        elif object_type in ['Notification', 'ServiceApplyRule']:
+            self.director_object_type = 'apply'
+        else:
+            self.director_object_type = 'object'
+
+        self.list_kind = COMMAND_KINDS.get(object_type)
+
+    @staticmethod
+    def get_selector(name: str) -> str:
+        """
+        return the selector addressing the object name
+        """
+
+        return f'name={_quote(name)}'
+
+    def get_create_payload(self, name: str) -> dict:
+        """
+        return the base payload creating the object name
+        """
+
+        return {
+            'object_name': name,
+            'object_type': self.director_object_type,
+        }
+
+
+class _ServiceHandler(_Handler):
+    """
+    Service objects are addressed as "hostname!servicename"
+    """
+
+    __slots__ = ()
+
+    @staticmethod
+    def get_selector(name: str) -> str:
+        host, service = _split_service_name(name)
+        return f'host={_quote(host)}&name={_quote(service)}'
+
+    def get_create_payload(self, name: str) -> dict:
+        host, service = _split_service_name(name)
+        return {
+            'object_name': service,
+            'object_type': self.director_object_type,
+            'host': host,
+        }
+
+
+# supported object types and their handlers, endpoints are derived from the type name
+_HANDLER_CLASSES = {
+    'Command': _Handler,
+    'CommandTemplate': _Handler,
+    'Endpoint': _Handler,
+    'Host': _Handler,
+    'HostGroup': _Handler,
+    'HostTemplate': _Handler,
+    'Notification': _Handler,
+    'NotificationTemplate': _Handler,
+    'Service': _ServiceHandler,
+    'ServiceApplyRule': _Handler,
+    'ServiceGroup': _Handler,
+    'ServiceTemplate': _Handler,
+    'Timeperiod': _Handler,
+    'TimeperiodTemplate': _Handler,
+    'User': _Handler,
+    'UserGroup': _Handler,
+    'UserTemplate': _Handler,
+    'Zone': _Handler
+}
+
+ALLOWED_TYPES = tuple(_HANDLER_CLASSES)
+
+# handlers built so far, by (base_url_path, object_type)
+_HANDLERS: dict = {}
+
+
 class Objects(Base):
     """
     Icinga 2 API objects class
     """
 
+    __slots__ = ()
+
     base_url_path = 'icingaweb2/director'
 
-    @staticmethod
-    def _get_endpoint(object_type: str,
-                      mode: str) -> str:
+    def _get_handler(self,
+                     object_type: str) -> _Handler:
+        """
+        validate object_type and return its handler for this class' base_url_path
         """
-        validate object_type and return Icinga Director API endpoint
-        """
-
-        allowed_types = [
-            'Command',
-            'CommandTemplate',
-            'Endpoint',
-            'Host',
-            'HostGroup',
-            'HostTemplate',
-            'Notification',
-            'NotificationTemplate',
-            'Service',
-            'ServiceApplyRule',
-            'ServiceGroup',
-            'ServiceTemplate',
-            'Timeperiod',
-            'TimeperiodTemplate',
-            'User',
-            'UserGroup',
-            'UserTemplate',
-            'Zone'
-        ]
-
-        if object_type not in allowed_types:
+
+        key = (self.base_url_path, object_type)
+        try:
+            return _HANDLERS[key]
+        except KeyError:
+            pass
+
+        try:
+            handler_class = _HANDLER_CLASSES[object_type]
+        except KeyError:
             raise IcingaDirectorApiException(f'Icinga Director object type "{object_type}" does '
-                                             f'not exist or is not supported yet).')
+                                             f'not exist or is not supported yet).') from None
 
-        if mode == 'list':
-            if object_type.startswith('Command'):
-                return 'commands'
-            if object_type.endswith('Template'):
-                return object_type.lower().replace('template', 's/templates')
-            if object_type in ['Notification', 'ServiceApplyRule']:
-                return object_type.replace('ApplyRule', '').lower() + 's/applyrules'
-            return object_type.lower() + 's'
+        handler = _HANDLERS[key] = handler_class(object_type, self.base_url_path)
+        return handler
 
-        if mode in ['create', 'delete', 'get', 'modify']:
-            return object_type.lower().replace('template', '').replace('applyrule', '')
+    def _get_url_path(self,
+                      object_type: str,
+                      mode: str) -> str:
+        """
+        validate object_type and return the url path of its Icinga Director API endpoint
+        """
 
-        raise IcingaDirectorApiException(f'API request mode "{mode}" does not exist. Allowed '
-                                         f'values: ["create", "delete", "get", "list", "modify"]')
+        try:
+            return self._get_handler(object_type).url_paths[mode]
+        except KeyError:
+            raise IcingaDirectorApiException(f'API request mode "{mode}" does not exist. Allowed '
+                                             f'values: ["create", "delete", "get", "list", '
+                                             f'"modify"]') from None
 
-    @staticmethod
-    def _split_service_name(name: str) -> tuple:
+    def _get_list_url_path(self,
+                           object_type: str,
+                           query: str = None) -> str:
         """
-        separate host and service name
+        return the url path listing (and filtering) objects of given type
         """
 
-        if name.count('!') != 1:
-            raise IcingaDirectorApiException(
-                'Service object must have form "hostname!servicename".')
-        splitnames: list = name.split('!')
-        return splitnames[0], splitnames[1]
+        handler = self._get_handler(object_type)
+        url_path = handler.url_paths['list']
 
-    def _get_selector(self,
-                      object_type: str,
-                      name: str) -> str:
+        params: list = []
+        if query:
+            params.append(f'q={_quote(query)}')
+        if handler.list_kind:
+            # let Director return only the wanted half of the shared commands endpoint
+            params.append(f'object_type={handler.list_kind}')
+
+        if params:
+            url_path += '?' + '&'.join(params)
+
+        return url_path
+
+    def _get_create_payload(self,
+                            object_type: str,
+                            name: str,
+                            templates: List[str] = None,
+                            attrs: dict = None) -> dict:
+        """
+        return the payload creating an object of given type
         """
-        return object selector for given object_type
+
+        payload: dict = self._get_handler(object_type).get_create_payload(name)
+
+        # merge attributes in place instead of building a new dict
+        if attrs:
+            payload.update(attrs)
+        if templates:
+            payload['imports'] = templates
+
+        return payload
+
+    def _get_object_url_path(self,
+                             object_type: str,
+                             name: str,
+                             mode: str) -> str:
+        """
+        return the url path addressing a single object for mode get, modify or delete
+        """
+
+        handler = self._get_handler(object_type)
+
+        return f'{handler.url_paths[mode]}?{handler.get_selector(name)}'
+
+    def _invalidate(self,
+                    object_type: str):
         """
+        drop cached GET responses of all endpoints of object_type
+        (e.g. "host" covers "host?name=...", "hosts" and "hosts/templates")
 
-        if object_type == 'Service':
-            host, service = self._split_service_name(name)
-            return f'host={host}&name={service}'
+        Writes cascading to other object types (e.g. a deleted Host's Services) are not tracked.
+        """
 
-        return f'name={name}'
+        self.manager.invalidate_cache(self._get_url_path(object_type, 'create'))
 
     def get(self,
             object_type: str,
@@ -111,10 +288,7 @@ class Objects(Base):
         get('ServiceApplyRule', 'ping4')
         """
 
-        endpoint = self._get_endpoint(object_type, 'get')
-        selector = self._get_selector(object_type, name)
-
-        url_path = f'{self.base_url_path}/{endpoint}?{selector}'
+        url_path = self._get_object_url_path(object_type, name, 'get')
 
         return self._request('GET', url_path)
 
@@ -139,21 +313,37 @@ class Objects(Base):
         list('Host', query='webserver')
         """
 
-        object_type_url_path = self._get_endpoint(object_type, 'list')
-        url_path = f'{self.base_url_path}/{object_type_url_path}'
+        url_path = self._get_list_url_path(object_type, query)
 
-        if query:
-            url_path += f'?q={query}'
+        return _filter_kind(self._request('GET', url_path)['objects'],
+                            self._get_handler(object_type).list_kind)
 
-        if object_type == 'Command':
-            return [c for c in
-                    self._request('GET', url_path)['objects'] if c["object_type"] == "object"]
+    def iter_list(self,
+                  object_type: str,
+                  query: str = None):
+        """
+        iterate over all objects of given type (by name) while they are downloaded
 
-        if object_type == 'CommandTemplate':
-            return [c for c in
-                    self._request('GET', url_path)['objects'] if c["object_type"] == "template"]
+        Same as list(), but yields the objects one by one, so large responses never
+        have to be held in memory at once. Streaming requires the optional dependency
+        ijson, responses are not cached.
 
-        return self._request('GET', url_path)['objects']
+        :param object_type: type of the object
+        :type object_type: string
+        :param query: filters items by name
+        :type query: string
+
+        example:
+        for host in iter_list('Host'):
+            print(host['object_name'])
+        """
+
+        url_path = self._get_list_url_path(object_type, query)
+        kind = self._get_handler(object_type).list_kind
+
+        for obj in self._stream(url_path, 'objects.item'):
+            if kind is None or obj["object_type"] == kind:
+                yield obj
 
     def create(self,
                object_type: str,
@@ -185,35 +375,13 @@ class Objects(Base):
                ['generic-service'])
         """
 
-        endpoint: str = self._get_endpoint(object_type, 'create')
+        url_path = self._get_url_path(object_type, 'create')
+        payload = self._get_create_payload(object_type, name, templates, attrs)
 
-        url_path = f'{self.base_url_path}/{endpoint}'
+        result = self._request('POST', url_path, payload)
+        self._invalidate(object_type)
 
-        host: str = ''
-        if object_type == 'Service':
-            host, name = self._split_service_name(name)
-
-        if object_type.endswith('Template'):
-            object_type = 'template'
-        elif object_type in ['Notification', 'ServiceApplyRule']:
-            object_type = 'apply'
-        else:
-            object_type = 'object'
-
-        payload: dict = {
-            'object_name': name,
-            'object_type': object_type,
-        }
-
-        if host:
-            payload['host'] = host
-
-        if attrs:
-            payload = {**payload, **attrs}
-        if templates:
-            payload['imports'] = templates
-
-        return self._request('POST', url_path, payload)
+        return result
 
     def modify(self,
                object_type: str,
@@ -235,12 +403,12 @@ class Objects(Base):
         example 2:
         modify('Service', 'testhost3!dummy', {'check_interval': '10m'})
         """
-        endpoint: str = self._get_endpoint(object_type, 'modify')
-        selector = self._get_selector(object_type, name)
+        url_path = self._get_object_url_path(object_type, name, 'modify')
 
-        url_path = f'{self.base_url_path}/{endpoint}?{selector}'
+        result = self._request('POST', url_path, attrs)
+        self._invalidate(object_type)
 
-        return self._request('POST', url_path, attrs)
+        return result
 
     def delete(self,
                object_type: str,
@@ -260,9 +428,105 @@ class Objects(Base):
         delete('Service', 'testhost3!dummy')
         """
 
-        endpoint = self._get_endpoint(object_type, 'delete')
-        selector = self._get_selector(object_type, name)
+        url_path = self._get_object_url_path(object_type, name, 'delete')
+
+        result = self._request('DELETE', url_path)
+        self._invalidate(object_type)
+
+        return result
+
+    @staticmethod
+    def _run_many(calls: List[Callable],
+                  return_exceptions: bool) -> List:
+        """
+        run the given calls one after another on the shared session
+
+        Failed calls, including transport errors like timeouts, either raise (default) or
+        return their exception in place of the response.
+        """
 
-        url_path = f'{self.base_url_path}/{endpoint}?{selector}'
+        results: List = []
+        for call in calls:
+            try:
+                results.append(call())
+            except (IcingaDirectorApiException, requests.RequestException) as error:
+                if not return_exceptions:
+                    raise
+                results.append(error)
+
+        return results
+
+    def create_many(self,
+                    object_type: str,
+                    items: List[dict],
+                    return_exceptions: bool = False) -> List:
+        """
+        create many objects of the same type
+
+        :param object_type: type of the objects
+        :type object_type: string
+        :param items: objects with key "name" and optional keys "templates" and "attrs"
+        :type items: list of dictionaries
+        :param return_exceptions: return failed requests' exceptions instead of raising the first
+        :type return_exceptions: bool
+        :returns: the responses (or exceptions) in the order of items
+        :rtype: list
+
+        example:
+        create_many('Host',
+                    [{'name': 'host1', 'templates': ['generic-host']},
+                     {'name': 'host2', 'attrs': {'address': '127.0.0.2'}}])
+        """
+
+        return self._run_many(
+            [lambda i=i: self.create(object_type, i['name'], i.get('templates'), i.get('attrs'))
+             for i in items], return_exceptions)
+
+    def modify_many(self,
+                    object_type: str,
+                    items: List[dict],
+                    return_exceptions: bool = False) -> List:
+        """
+        modify many objects of the same type
+
+        :param object_type: type of the objects
+        :type object_type: string
+        :param items: objects with keys "name" and "attrs"
+        :type items: list of dictionaries
+        :param return_exceptions: return failed requests' exceptions instead of raising the first
+        :type return_exceptions: bool
+        :returns: the responses (or exceptions) in the order of items
+        :rtype: list
+
+        example:
+        modify_many('Host',
+                    [{'name': 'host1', 'attrs': {'address': '127.0.1.1'}},
+                     {'name': 'host2', 'attrs': {'address': '127.0.1.2'}}])
+        """
+
+        return self._run_many(
+            [lambda i=i: self.modify(object_type, i['name'], i['attrs']) for i in items],
+            return_exceptions)
+
+    def delete_many(self,
+                    object_type: str,
+                    names: List[str],
+                    return_exceptions: bool = False) -> List:
+        """
+        delete many objects of the same type
+
+        :param object_type: type of the objects
+        :type object_type: string
+        :param names: the names of the objects
+        :type names: list
+        :param return_exceptions: return failed requests' exceptions instead of raising the first
+        :type return_exceptions: bool
+        :returns: the responses (or exceptions) in the order of names
+        :rtype: list
+
+        example:
+        delete_many('Service', ['host1!ping4', 'host2!ping4'])
+        """
 
-        return self._request('DELETE', url_path)
+        return self._run_many(
+            [lambda n=n: self.delete(object_type, n) for n in names], return_exceptions)
@@ -3,8 +3,12 @@
 Icinga Director API functionality tests
 """
 
+import asyncio
+
 from test_objects import test_objects  # pylint: disable=import-error
+from IcingaDirectorAPI.async_director import AsyncDirector  # pylint: disable=import-error
 from IcingaDirectorAPI.director import Director  # pylint: disable=import-error
+from IcingaDirectorAPI.exceptions import IcingaDirectorApiException  # pylint: disable=import-error
 
 # default credentials & localhost for testing, e.g. with a local container
 director = Director('http://localhost:8080', 'icingaadmin', 'icinga')
@@ -21,6 +25,7 @@ def create_test():
 
         object_list: list = [o['object_name'] for o in director.objects.list(object_type)]
         print(f'list: {object_list}')
+        assert object_list == [o['object_name'] for o in director.objects.iter_list(object_type)]
 
         for object_name, object_definition in objects.items():
             if object_name not in object_list:
@@ -51,6 +56,12 @@ def create_test():
                 else:
                     director.objects.get(object_type, object_name)
 
+    print('\ntrying to get and list objects with url-encoded names ...')
+    assert director.objects.get('Host', 'h_test 3&co')['object_name'] == 'h_test 3&co'
+    assert director.objects.get('Service',
+                                'h_test 3&co!s_test 3&co')['object_name'] == 's_test 3&co'
+    assert 'h_test 3&co' in [h['object_name'] for h in director.objects.list('Host', query='3&co')]
+
 
 # --- MODIFY
 def modify_test():
@@ -75,6 +86,10 @@ def modify_test():
     print('trying to modify object h_test1 ...')
     director.objects.modify('Host', 'h_test1', {'vars': {'os': 'Linux', 'processorcount': '24'}})
 
+    print('trying to modify object h_test 3&co ...')
+    director.objects.modify('Host', 'h_test 3&co', {'display_name': 'Test &? Co'})
+    assert director.objects.get('Host', 'h_test 3&co')['display_name'] == 'Test &? Co'
+
     print('trying to modify object hg_windows ...')
     director.objects.modify('HostGroup', 'hg_windows', {'display_name': 'Windows Hosts'})
 
@@ -102,6 +117,10 @@ def modify_test():
     print('trying to modify object s_test1 ...')
     director.objects.modify('Service', 'h_test1!s_test1', {'vars': {'blub': 'blab'}})
 
+    print('trying to modify object s_test 3&co ...')
+    director.objects.modify('Service', 'h_test 3&co!s_test 3&co', {'vars': {'blub': 'a&b'}})
+    assert director.objects.get('Service', 'h_test 3&co!s_test 3&co')['vars']['blub'] == 'a&b'
+
     print('trying to modify object sa_test1 ...')
     director.objects.modify('ServiceApplyRule', 'sa_test1', {'vars': {'testvar': 'Test'}})
 
@@ -109,6 +128,84 @@ def modify_test():
     director.objects.modify('ServiceGroup', 'sg_test1', {'display_name': 'Best Test Group'})
 
 
+# --- CACHE
+def cache_test():
+    """
+    Icinga Director API response cache invalidation test
+    """
+    cached_director = Director('http://localhost:8080', 'icingaadmin', 'icinga', cache_ttl=30)
+
+    print('\n\ntrying to get cached object h_test1 ...')
+    cached_director.objects.get('Host', 'h_test1')
+    assert cached_director.objects.get('Host', 'h_test1') == director.objects.get('Host', 'h_test1')
+
+    print('trying to modify cached object h_test1 ...')
+    cached_director.objects.modify('Host', 'h_test1', {'display_name': 'cache test'})
+    assert cached_director.objects.get('Host', 'h_test1')['display_name'] == 'cache test'
+    assert 'h_test1' in [h['object_name'] for h in cached_director.objects.list('Host')]
+
+    print('trying to read object h_test1 after clear_cache() ...')
+    director.objects.modify('Host', 'h_test1', {'display_name': None})
+    cached_director.clear_cache()
+    assert cached_director.objects.get('Host', 'h_test1').get('display_name') is None
+    cached_director.close()
+
+
+# --- BULK
+def bulk_test():
+    """
+    Icinga Director API create_many / modify_many / delete_many functionality test
+    """
+    print('\n\ntrying to create objects h_bulk1, h_bulk2 ...')
+    director.objects.create_many('Host', [{'name': 'h_bulk1', 'templates': ['ht_test1']},
+                                          {'name': 'h_bulk2', 'attrs': {'address': '127.0.0.2'}}])
+
+    print('trying to create existing object h_bulk1 again ...')
+    results: list = director.objects.create_many('Host', [{'name': 'h_bulk1'}],
+                                                 return_exceptions=True)
+    assert isinstance(results[0], IcingaDirectorApiException)
+
+    print('trying to modify objects h_bulk1, h_bulk2 ...')
+    director.objects.modify_many('Host', [{'name': 'h_bulk1', 'attrs': {'display_name': 'bulk 1'}},
+                                          {'name': 'h_bulk2', 'attrs': {'display_name': 'bulk 2'}}])
+    assert director.objects.get('Host', 'h_bulk1')['display_name'] == 'bulk 1'
+
+    print('trying to delete objects h_bulk1, h_bulk2 ...')
+    director.objects.delete_many('Host', ['h_bulk1', 'h_bulk2'])
+    host_list: list = [h['object_name'] for h in director.objects.list('Host')]
+    assert 'h_bulk1' not in host_list and 'h_bulk2' not in host_list
+
+
+# --- ASYNC
+async def async_test():
+    """
+    Icinga Director API asyncio client functionality test
+    """
+    async with AsyncDirector('http://localhost:8080', 'icingaadmin', 'icinga') as async_director:
+        print('\n\ntrying to get objects concurrently ...')
+        zones, host = await asyncio.gather(async_director.objects.list('Zone'),
+                                           async_director.objects.get('Host', 'h_test1'))
+        assert 'z_test1' in [z['object_name'] for z in zones]
+        assert host['object_name'] == 'h_test1'
+
+        print('trying to bulk create objects h_async1, h_async2 ...')
+        await async_director.objects.bulk_create(
+            [{'object_type': 'Host', 'name': 'h_async1', 'templates': ['ht_test1']},
+             {'object_type': 'Host', 'name': 'h_async2', 'templates': ['ht_test1']}])
+
+        print('trying to modify objects h_async1, h_async2 ...')
+        await async_director.objects.modify_many(
+            'Host', [{'name': 'h_async1', 'attrs': {'display_name': 'async 1'}},
+                     {'name': 'h_async2', 'attrs': {'display_name': 'async 2'}}])
+        host = await async_director.objects.get('Host', 'h_async2')
+        assert host['display_name'] == 'async 2'
+
+        print('trying to delete objects h_async1, h_async2 ...')
+        await async_director.objects.delete_many('Host', ['h_async1', 'h_async2'])
+        hosts = [h['object_name'] async for h in async_director.objects.iter_list('Host')]
+        assert 'h_async1' not in hosts and 'h_async2' not in hosts
+
+
 # --- DELETE
 def delete_test():
     """
@@ -135,4 +232,7 @@ def delete_test():
 if __name__ == '__main__':
     create_test()
     modify_test()
+    cache_test()
+    bulk_test()
+    asyncio.run(async_test())
     delete_test()
@@ -99,6 +99,11 @@ test_objects: dict = {
             'templates': ['ht_test2', 'ht_test1'],
             'attrs': {"address": "10.237.226.185", "display_name": "webserver12.test.com",
                       "zone": "z_test1", 'vars': {'os': 'Linux', 'processorcount': '4'}}
+        },
+        # names that have to be url-encoded
+        'h_test 3&co': {
+            'templates': ['ht_test1'],
+            'attrs': {'display_name': 'Test & Co'}
         }
     },
     'HostGroup': {
@@ -192,6 +197,11 @@ test_objects: dict = {
             'templates': ['st_test1'],
             'attrs': {'check_command': 'c_test2', 'display_name': 'Test Service',
                       'host': 'h_test2', 'vars': {'blub': 'blib'}}
+        },
+        's_test 3&co': {
+            'templates': ['st_test1'],
+            'attrs': {'check_command': 'c_test1', 'display_name': 'Test & Co Service',
+                      'host': 'h_test 3&co'}
         }
     },
     'ServiceApplyRule': {